@@ -2,15 +2,58 @@
 
 #: pylint: disable=duplicate-code, unused-import
 
-from lambda_handler.dependencies import Dependency  # noqa: F401
-from lambda_handler.handler import LambdaHandler  # noqa: F401
-from lambda_handler.model import (  # noqa: F401
-    DirectInvocationEvent,
-    EventBridgeEvent,
-    LambdaResponse,
-    S3Event,
-    SnsEvent,
-    SqsEvent,
-)
+import importlib
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from lambda_handler.dependencies import Dependency  # noqa: F401
+    from lambda_handler.handler import LambdaHandler  # noqa: F401
+    from lambda_handler.model import (  # noqa: F401
+        DirectInvocationEvent,
+        EventBridgeEvent,
+        LambdaResponse,
+        S3Event,
+        SnsEvent,
+        SqsEvent,
+    )
+
+__all__ = [
+    "Dependency",
+    "DirectInvocationEvent",
+    "EventBridgeEvent",
+    "LambdaHandler",
+    "LambdaResponse",
+    "S3Event",
+    "SnsEvent",
+    "SqsEvent",
+]
 
 __version__ = "2.0.0"
+
+# Names are imported from their modules on first access, so that importing the
+# package doesn't build every pydantic model up front
+_LAZY_IMPORTS: Dict[str, str] = {
+    "Dependency": "lambda_handler.dependencies",
+    "LambdaHandler": "lambda_handler.handler",
+    "DirectInvocationEvent": "lambda_handler.model",
+    "EventBridgeEvent": "lambda_handler.model",
+    "LambdaResponse": "lambda_handler.model",
+    "S3Event": "lambda_handler.model",
+    "SnsEvent": "lambda_handler.model",
+    "SqsEvent": "lambda_handler.model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
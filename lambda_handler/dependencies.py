@@ -2,79 +2,13 @@
 
 import inspect
 
-from typing import Callable, Generic, Iterator, Optional, TypeVar, Union
-from typing_extensions import TypeGuard
+from typing import Any, Callable, Generic, Iterator, TypeVar, Union, cast
 
 __all__ = ["Dependency", "DependencyC"]
 
 R = TypeVar("R")
 
-
-def is_generator(
-    func: Union[Callable[[], R], Callable[[], Iterator[R]]]
-) -> TypeGuard[Callable[[], Iterator[R]]]:
-    """Type guard to assert that `func` returns an `Iterator[R]`
-
-    Parameters
-    ----------
-    func : Union[Callable[P, R], Callable[P, Iterator[R]]]
-        Callable
-
-    Returns
-    -------
-    TypeGuard[Callable[P, Iterator[R]]]
-        `True` if `func` returns an `Iterator[R]`
-    """
-    return inspect.isgeneratorfunction(func)
-
-
-def is_not_generator(
-    func: Union[Callable[[], R], Callable[[], Iterator[R]]]
-) -> TypeGuard[Callable[[], R]]:
-    """Type guard to assert that `func` returns an `R`
-
-    Parameters
-    ----------
-    func : Union[Callable[P, R], Callable[P, Iterator[R]]]
-        Callable
-
-    Returns
-    -------
-    TypeGuard[Callable[P, R]]
-        `True` if `func` returns an `R`
-    """
-    return not inspect.isgeneratorfunction(func)
-
-
-def get_result(
-    func: Union[Callable[[], R], Callable[[], Iterator[R]]],
-) -> R:
-    """Get the result of calling a function; if necessary with `next`
-
-    Parameters
-    ----------
-    func : Union[Callable[P, R], Callable[P, Iterator[R]]]
-        Callable
-    *args : Any
-        Arguments of `func`
-    **kwargs : Any
-        Keyword arguments of `func`
-
-    Returns
-    -------
-    R
-        Return value of `func`
-
-    Raises
-    ------
-    ValueError
-        If we cannot get a result
-    """
-    if is_generator(func):
-        return next(func())
-    if is_not_generator(func):
-        return func()
-    raise ValueError("Cannot get here!")
+_MISSING = object()
 
 
 class DependencyC(Generic[R]):
@@ -88,6 +22,8 @@ class DependencyC(Generic[R]):
         Whether to cache the result of calling `dependency`
     """
 
+    __slots__ = ("dependency", "use_cache", "result", "_runner")
+
     def __init__(
         self,
         dependency: Union[Callable[[], R], Callable[[], Iterator[R]]],
@@ -96,12 +32,19 @@ class DependencyC(Generic[R]):
     ) -> None:
         self.dependency = dependency
         self.use_cache = use_cache
-        self.result: Optional[R] = None
+        self.result: Any = _MISSING
+        self._runner: Callable[[], R]
+        # Generator dependencies are detected once, here, rather than per call
+        if inspect.isgeneratorfunction(dependency):
+            generator = cast(Callable[[], Iterator[R]], dependency)
+            self._runner = lambda: next(generator())
+        else:
+            self._runner = cast(Callable[[], R], dependency)
 
     def __call__(self) -> R:
-        if self.result:
+        if self.result is not _MISSING:
             return self.result
-        result = get_result(self.dependency)
+        result = self._runner()
         if self.use_cache:
             self.result = result
         return result
@@ -1,9 +1,10 @@
 """Defines the main `LambdaHandler` class"""
 
 import re
+from functools import lru_cache
+from importlib.util import find_spec
 
 from lambda_handler.model import (
-    ApiGatewayEvent,
     AwsEvent,
     DirectInvocationEvent,
     EventBridgeEvent,
@@ -19,20 +20,22 @@ from lambda_handler.types import (
     MangumInterface,
 )
 from lambda_handler.utils import (
-    OnetimeDictionary,
     DictCallable,
     TypedCallable,
     _P,
     create_wrapper,
-    parse_lambda_event,
+    find_event_key,
+    find_event_type,
 )
 
 from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Literal,
     Optional,
+    Pattern,
     Tuple,
     Type,
     Union,
@@ -47,13 +50,92 @@ __all__ = ["InvalidRouteError", "ExistingRouteError", "LambdaHandler"]
 Bool: TypeAlias = Union[Literal[True], Literal[False]]
 
 
-VALID_EVENTS = [
-    "DirectInvocationEvent",
-    "EventBridgeEvent",
-    "S3Event",
-    "SqsEvent",
-    "SnsEvent",
-]
+VALID_EVENTS = frozenset(
+    {
+        "DirectInvocationEvent",
+        "EventBridgeEvent",
+        "S3Event",
+        "SqsEvent",
+        "SnsEvent",
+    }
+)
+
+
+# Mangum adapters, shared between handlers for the same FastAPI instance. Each
+# adapter holds its FastAPI instance alive, so an `id` is never reused
+_MANGUM_CACHE: Dict[int, MangumInterface] = {}
+
+
+def _get_mangum(fastapi_app: FastApiInterface) -> MangumInterface:
+    """The Mangum adapter for `fastapi_app`, created on first use
+
+    Parameters
+    ----------
+    fastapi_app : FastApiInterface
+        FastAPI app instance
+
+    Returns
+    -------
+    MangumInterface
+        Mangum adapter for `fastapi_app`
+    """
+    mangum = _MANGUM_CACHE.get(id(fastapi_app))
+    if mangum is None:
+        #: pylint: disable=import-outside-toplevel
+        from mangum import Mangum
+
+        mangum = _MANGUM_CACHE[id(fastapi_app)] = Mangum(fastapi_app)
+    return mangum
+
+
+# Characters with a special meaning in a regular expression; route keys
+# without any of them are matched as plain strings
+_REGEX_METACHARACTERS = re.compile(r"[\\^$.|?*+()\[\]{}]")
+
+
+def _compile_route(event_key: str) -> Optional[Pattern[str]]:
+    """Compile a route key, unless it is a plain string
+
+    Parameters
+    ----------
+    event_key : str
+        Route key, which may be a regular expression
+
+    Returns
+    -------
+    Optional[Pattern[str]]
+        Compiled route key, or `None` if it has no special characters
+    """
+    if _REGEX_METACHARACTERS.search(event_key) is None:
+        return None
+    return re.compile(event_key)
+
+
+@lru_cache(maxsize=None)
+def _route_type(event_type: Type[AwsEvent]) -> Type[AwsEvent]:
+    """The event type that routes for `event_type` are registered against
+
+    Parameters
+    ----------
+    event_type : Type[AwsEvent]
+        Event type, which may be parametrised, e.g. `SnsEvent[MyModel]`
+
+    Returns
+    -------
+    Type[AwsEvent]
+        The unparametrised event type, e.g. `SnsEvent`
+
+    Raises
+    ------
+    ValueError
+        If `event_type` is not one of the `VALID_EVENTS`
+    """
+    for cls in event_type.__mro__:
+        if cls.__qualname__ in VALID_EVENTS:
+            return cls
+    raise ValueError(
+        f"I don't know what to do with an event of type `{event_type.__qualname__}`!"
+    )
 
 
 class InvalidRouteError(Exception):
@@ -103,31 +185,31 @@ class LambdaHandler(LambdaHandlerInterface):
     ```
     """
 
+    __slots__ = (
+        "_events_dict",
+        "_routes",
+        "_fastapi_app",
+        "_mangum",
+        "_dispatch",
+    )
+
     def __init__(self, fastapi_app: Optional[FastApiInterface] = None):
-        self._events_dict: Dict[Tuple[str, str], AwsEventRawCallable] = (
-            OnetimeDictionary()
-        )
+        # Functions for each route; `add_event_func` checks for duplicate routes
+        self._events_dict: Dict[Tuple[Type[AwsEvent], str], AwsEventRawCallable] = {}
+        # Route keys, their compiled patterns (`None` for plain strings), and
+        # their functions for each event type, in the order they were registered
+        self._routes: Dict[
+            Type[AwsEvent],
+            List[Tuple[str, Optional[Pattern[str]], AwsEventRawCallable]],
+        ] = {}
         self._fastapi_app: Optional[FastApiInterface] = None
         self._mangum: Optional[MangumInterface] = None
+        self._dispatch: Callable[
+            [Dict[str, Any], LambdaContext], Dict[str, Any]
+        ] = self._process_aws_event
 
         if fastapi_app is not None:
-            try:
-                #: pylint: disable=import-outside-toplevel
-                from fastapi import FastAPI
-                from mangum import Mangum
-
-                #: pylint: enable=import-outside-toplevel
-            except ImportError:
-                raise ImportError(
-                    "Cannot import FastAPI and Mangum! Are these installed?"
-                ) from None  #: noqa
-
-            cast(FastAPI, fastapi_app)
-            self._fastapi_app = fastapi_app
-            self._mangum = Mangum(fastapi_app)
-
-    def __call__(self, event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
-        return self.process_event(event, context)
+            self._set_fastapi_app(fastapi_app)
 
     @property
     def fastapi_app(self) -> Optional[FastApiInterface]:
@@ -142,41 +224,65 @@ class LambdaHandler(LambdaHandlerInterface):
 
     @fastapi_app.setter
     def fastapi_app(self, fastapi_app: FastApiInterface) -> None:
+        self._set_fastapi_app(fastapi_app)
+
+    def _set_fastapi_app(self, fastapi_app: FastApiInterface) -> None:
+        """Set the FastAPI app instance
+
+        FastAPI is imported here rather than with this module, so that handlers
+        without a FastAPI instance never import it, and the Mangum handler is
+        only created by `mangum` for the first HTTP request
+
+        Parameters
+        ----------
+        fastapi_app : FastApiInterface
+            FastAPI app instance
+
+        Raises
+        ------
+        ImportError
+            If FastAPI and Mangum are not installed
+        ValueError
+            If `fastapi_app` is not a `FastAPI` instance
+        """
+        #: pylint: disable=import-outside-toplevel
         try:
-            #: pylint: disable=import-outside-toplevel
             from fastapi import FastAPI
-            from mangum import Mangum
 
-            #: pylint: enable=import-outside-toplevel
-        except ImportError:
+            if find_spec("mangum") is None:
+                raise ImportError
+        except ImportError:  # pragma: no cover
             raise ImportError(
                 "Cannot import FastAPI and Mangum! Are these installed?"
             ) from None
         if not isinstance(fastapi_app, FastAPI):
             raise ValueError("`fastapi_app` must be a `FastAPI` instance!")
         self._fastapi_app = fastapi_app
-        self._mangum = Mangum(fastapi_app)
+        self._mangum = None
+        self._dispatch = self._process_any_event
 
     @property
     def mangum(self) -> Optional[MangumInterface]:
-        """Mangum handler instance, if there is one
+        """Mangum handler instance, if there is a FastAPI instance
 
         Returns
         -------
         Optional[MangumInterface]
-            Mangum app instance, if there is one
+            Mangum app instance, if there is a FastAPI instance
         """
+        if self._mangum is None and self._fastapi_app is not None:
+            self._mangum = _get_mangum(self._fastapi_app)
         return self._mangum
 
     def _find_function(
-        self, event_type_name: str, event_key: str
+        self, event_type: Type[AwsEvent], event_key: str
     ) -> AwsEventRawCallable:
         """Find the handling function for the given event type and key
 
         Parameters
         ----------
-        event_type_name : str
-            Name of the event class
+        event_type : Type[AwsEvent]
+            Event class
         event_key : str
             Event key
 
@@ -191,21 +297,24 @@ class LambdaHandler(LambdaHandlerInterface):
             If no handling function is found
         """
 
-        for (event_type, key), func in self._events_dict.items():
-            if event_type == event_type_name:
-                if re.match(key, event_key):
+        for key, pattern, func in self._routes.get(event_type, ()):
+            # A plain key matches as `re.match` would, at the start of the event key
+            if pattern is None:
+                if event_key.startswith(key):
                     return func
+            elif pattern.match(event_key):
+                return func
 
         raise InvalidRouteError(
-            f"No valid route for event type `{event_type_name}` and event key"
+            f"No valid route for event type `{event_type.__qualname__}` and event key"
             f" `{event_key}`"
         )
 
     def process_event(
         self, event: Dict[str, Any], context: LambdaContext
     ) -> Dict[str, Any]:
-        """Process an event into an `AwsEvent` instance and pass it to its
-        handling function
+        """Identify the type and key of an event and pass it to its handling
+        function
 
         Parameters
         ----------
@@ -223,24 +332,78 @@ class LambdaHandler(LambdaHandlerInterface):
         ------
         InvalidRouteError
             Raised when there is no valid route for the event
+        NoFastAPIInstanceError
+            Raised for API Gateway events when there is no FastAPI instance
         """
-        parsed_event = parse_lambda_event(event)
+        return self._dispatch(event, context)
 
-        if not isinstance(parsed_event, ApiGatewayEvent):
-            event_type_name = type(parsed_event).__qualname__.split("[")[0]
+    def __call__(self, event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+        return self.process_event(event, context)
 
-            func = self._find_function(event_type_name, parsed_event.event_key)
+    def _process_aws_event(
+        self, event: Dict[str, Any], context: LambdaContext
+    ) -> Dict[str, Any]:
+        """Process an event when there is no FastAPI instance, in which case
+        API Gateway events fail to find a route
 
-            # The function itself parses the event so we don't need to
-            # pass the parsed event
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Event dictionary
+        context : LambdaContext
+            Lambda context object
 
-            return func(event)
+        Returns
+        -------
+        Dict[str, Any]
+            Response dictionary
 
-        if self.mangum is None:
+        Raises
+        ------
+        NoFastAPIInstanceError
+            If `event` is an API Gateway event
+        """
+        #: pylint: disable=unused-argument
+        # The same check as `ApiGatewayEvent.matches_event_type`, made before
+        # looking for the type of any other event
+        if "pathParameters" in event:
             raise NoFastAPIInstanceError("No FastAPI instance set on handler!")
 
-        #: pylint: disable=not-callable
-        return self.mangum(parsed_event.__root__, context)
+        event_type = find_event_type(event)
+        func = self._find_function(event_type, find_event_key(event_type, event))
+
+        # The function itself parses the event, if it needs to, so routing
+        # only reads the event key
+
+        return func(event)
+
+    def _process_any_event(
+        self, event: Dict[str, Any], context: LambdaContext
+    ) -> Dict[str, Any]:
+        """Process an event when there is a FastAPI instance, which handles
+        API Gateway events
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Event dictionary
+        context : LambdaContext
+            Lambda context object
+
+        Returns
+        -------
+        Dict[str, Any]
+            Response dictionary
+        """
+        # The same check as `ApiGatewayEvent.matches_event_type`, made before
+        # looking for the type of any other event
+        if "pathParameters" in event:
+            #: pylint: disable=not-callable
+            return cast(MangumInterface, self.mangum)(event, context)
+
+        event_type = find_event_type(event)
+        func = self._find_function(event_type, find_event_key(event_type, event))
+        return func(event)
 
     def add_event_func(
         self,
@@ -259,19 +422,56 @@ class LambdaHandler(LambdaHandlerInterface):
         func: Union[AwsEventTypedCallable[AwsEvent], AwsEventRawCallable]
             The callable to register the event for
         """
-        if event_type.__qualname__ not in VALID_EVENTS:
-            raise ValueError(
-                f"I don't know what to do with an event of type `{event_key}`!"
+        event_type = _route_type(event_type)
+        route = (event_type, event_key)
+        existing_func = self._events_dict.get(route)
+        if existing_func is not None:
+            raise ExistingRouteError(
+                f"Route {event_key} for event type {event_type.__qualname__} is"
+                f" already registered by function {existing_func.__qualname__}"
             )
-        event_type_name = event_type.__qualname__.split("[")[0]
-        try:
-            self._events_dict[(event_type_name, event_key)] = func
-        except ValueError:
-            existing_func = self._events_dict[(event_type_name, event_key)]
-            msg = (
-                "Route {} for event type {} is already registered by function {}"
-            ).format(event_key, event_type_name, existing_func.__qualname__)
-            raise ExistingRouteError(msg) from None
+        self._events_dict[route] = func
+        # Route keys are compiled once, here, rather than for every event
+        self._routes.setdefault(event_type, []).append(
+            (event_key, _compile_route(event_key), func)
+        )
+
+    def clear(self) -> None:
+        """Remove every registered event function from the instance; the
+        FastAPI instance, if there is one, is kept
+        """
+        self._events_dict.clear()
+        self._routes.clear()
+
+    def _register(
+        self, event_type: Type[AwsEvent], event_key: str, raw: Bool
+    ) -> Union[
+        Callable[[TypedCallable], AwsEventRawCallable],
+        Callable[[DictCallable], AwsEventRawCallable],
+    ]:
+        """Create the decorator that registers functions for `event_type`
+        and `event_key`; shared by all of the event type methods
+
+        Parameters
+        ----------
+        event_type : Type[AwsEvent]
+            Event type
+        event_key : str
+            Event key (topic name, queue name, etc)
+        raw : bool
+            Whether the wrapped function accepts and returns a `Dict[str, Any]`
+
+        Returns
+        -------
+        Union[
+            Callable[[TypedCallable], AwsEventRawCallable],
+            Callable[[DictCallable], AwsEventRawCallable],
+        ]
+            Decorator for the handling function
+        """
+        return create_wrapper(
+            handler=self, event_type=event_type, event_key=event_key, raw=raw
+        )
 
     @overload
     def direct_invocation(
@@ -323,19 +523,7 @@ class LambdaHandler(LambdaHandlerInterface):
             return LambdaResponse(status_code=200, body=body)
         ```
         """
-        if raw:
-            return create_wrapper(
-                handler=self,
-                event_type=DirectInvocationEvent,
-                event_key=trigger_name,
-                raw=True,
-            )
-        return create_wrapper(
-            handler=self,
-            event_type=DirectInvocationEvent,
-            event_key=trigger_name,
-            raw=False,
-        )
+        return self._register(DirectInvocationEvent, trigger_name, raw)
 
     @overload
     def event_bridge(
@@ -381,13 +569,7 @@ class LambdaHandler(LambdaHandlerInterface):
             return LambdaResponse(status_code=200, body=body)
         ```
         """
-
-        return create_wrapper(
-            handler=self,
-            event_type=EventBridgeEvent,
-            event_key=resource_name,
-            raw=raw,
-        )
+        return self._register(EventBridgeEvent, resource_name, raw)
 
     @overload
     def s3(
@@ -422,13 +604,7 @@ class LambdaHandler(LambdaHandlerInterface):
         AwsEventTypedCallable[S3Event]
             A callable that handles an S3Event, or a Dict[str, Any]
         """
-
-        return create_wrapper(
-            handler=self,
-            event_type=S3Event,
-            event_key=event_name,
-            raw=raw,
-        )
+        return self._register(S3Event, event_name, raw)
 
     @overload
     def sns(
@@ -467,13 +643,7 @@ class LambdaHandler(LambdaHandlerInterface):
         AwsEventTypedCallable[SnsEvent]
             A callable that handles an SnsEvent, or a Dict[str, Any]
         """
-
-        return create_wrapper(
-            handler=self,
-            event_type=SnsEvent,
-            event_key=topic_name,
-            raw=raw,
-        )
+        return self._register(SnsEvent, topic_name, raw)
 
     @overload
     def sqs(
@@ -508,10 +678,4 @@ class LambdaHandler(LambdaHandlerInterface):
         AwsEventTypedCallable[SqsEvent]
             A callable that handles an SqsEvent, or a Dict[str, Any]
         """
-
-        return create_wrapper(
-            handler=self,
-            event_type=SqsEvent,
-            event_key=queue_name,
-            raw=raw,
-        )
+        return self._register(SqsEvent, queue_name, raw)
@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
-import json
+from json import dumps as _std_json_dumps
+from types import MappingProxyType
 
 #: pylint: disable=no-name-in-module
-from pydantic import ConstrainedStr, Field
+from pydantic import ConstrainedStr, Field, PrivateAttr
 from pydantic.generics import GenericModel
 
-from typing import Any, Dict, Generic, Optional, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Optional, Set, TypeVar
 
 #: pylint: enable=no-name-in-module
 
+try:
+    from orjson import OPT_NON_STR_KEYS, JSONEncodeError
+    from orjson import dumps as _orjson_dumps
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return _orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+        except JSONEncodeError:
+            # orjson rejects some objects `json` can encode, such as integers
+            # wider than 64 bits
+            return _std_json_dumps(obj)
+
+except ImportError:  # pragma: no cover
+
+    def _json_dumps(obj: Any) -> str:
+        return _std_json_dumps(obj)
+
 
 __all__ = [
     "ApiGatewayEvent",
     "AwsAccountNumber",
     "BranchBaseModel",
+    "cached_model_property",
     "BranchGenericModel",
     "DataT",
     "UnparseableResposeDictionary",
@@ -37,9 +56,12 @@ def to_camel(name: str) -> str:
     str
         Result, in `camelCase`
     """
-    first, *others = name.split("_")
-    remainder = "".join(map(str.title, others))
-    return first + remainder
+    first, separator, others = name.partition("_")
+    if not separator:
+        return name
+    # Underscores are uncased, so titling the remainder in one go titles each
+    # of its words, as if they were titled separately
+    return first + others.title().replace("_", "")
 
 
 class AwsAccountNumber(ConstrainedStr):
@@ -61,6 +83,9 @@ class BranchGenericModel(GenericModel, Generic[DataT]):
         alias_generator = to_camel
         allow_population_by_field_name = True
         arbitrary_types_allowed = True
+        # Events are parsed once and not mutated, so sub-models that are
+        # already model instances are used as they are, rather than copied
+        copy_on_model_validation = "none"
         extra = "allow"
         underscore_attrs_are_private = True
 
@@ -68,9 +93,63 @@ class BranchGenericModel(GenericModel, Generic[DataT]):
 BranchBaseModel = BranchGenericModel[Any]
 
 
+if TYPE_CHECKING:
+    # To mypy, a cached property is a property, so it can override one
+    cached_model_property = property
+
+else:
+
+    class cached_model_property(property):
+        """A read-only property of an `AwsEvent`, computed once per instance
+
+        `functools.cached_property` stores its value in the instance
+        `__dict__`, which pydantic treats as the model's fields; this stores it
+        in the model's private `_cache` instead, so it doesn't leak into
+        `.dict()`
+        """
+
+        def __init__(self, fget: Callable[[Any], Any]) -> None:
+            super().__init__(fget)
+            self.name = fget.__name__
+
+        def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+            if instance is None:
+                return self
+            #: pylint: disable=protected-access
+            cache = instance._cache
+            try:
+                return cache[self.name]
+            except KeyError:
+                value = cache[self.name] = self.fget(instance)
+                return value
+
+
 class AwsEvent(BranchGenericModel, Generic[DataT]):
     """Generic Pydantic model for *event* models"""
 
+    _cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def _copy_and_set_values(
+        self,
+        values: Dict[str, Any],
+        fields_set: Set[str],
+        *,
+        deep: bool,
+    ) -> AwsEvent[DataT]:
+        # Private attributes are copied with the model, but a copy's fields
+        # may be updated, so it starts with an empty cache
+        copied = super()._copy_and_set_values(values, fields_set, deep=deep)
+        #: pylint: disable=protected-access
+        copied._cache = {}
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Cached properties are computed from fields, so assigning to one
+        # clears them; private attributes, the cache among them, don't
+        if not name.startswith("_"):
+            self._cache.clear()
+
     @property
     def event_key(self) -> str:
         """The event key for this particular event type
@@ -109,6 +188,28 @@ class AwsEvent(BranchGenericModel, Generic[DataT]):
         """
         raise NotImplementedError()
 
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed event of this type, read without
+        validating the event; used for routing
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+
+        Raises
+        ------
+        NotImplementedError
+            In the base class
+        """
+        raise NotImplementedError()
+
 
 class ApiGatewayEvent(AwsEvent):
     """API Gateway API Proxy event; this model should not be used
@@ -150,6 +251,22 @@ class ApiGatewayEvent(AwsEvent):
         """
         return "pathParameters" in event
 
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """Implement `raw_event_key`, even though we will never call it
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return ""
+
 
 class UnparseableResposeDictionary(Exception):
     """Raised when a `LambdaResponse` cannot parse a response dictionary"""
@@ -170,13 +287,17 @@ class LambdaResponse:
         Response headers, by default `None`
     """
 
-    DEFAULT_HEADERS = {
-        "Access-Control-Allow-Origin": "*",
-        "Access-Control-Allow-Headers": "*",
-        "Access-Control-Allow-Credentials": True,
-        "Content-Type": "application/json",
-        "X-Requested-With": "*",
-    }
+    __slots__ = ("is_base64_encoded", "status_code", "_body", "headers", "_raw_body")
+
+    DEFAULT_HEADERS = MappingProxyType(
+        {
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "*",
+            "Access-Control-Allow-Credentials": True,
+            "Content-Type": "application/json",
+            "X-Requested-With": "*",
+        }
+    )
 
     def __init__(
         self,
@@ -187,19 +308,40 @@ class LambdaResponse:
         self.is_base64_encoded = False
         self.status_code = status_code
         self.body = body
-        self.headers = headers or self.DEFAULT_HEADERS
+        # A copy, so that changing one response's headers doesn't change the
+        # defaults for every other response
+        self.headers = headers or dict(self.DEFAULT_HEADERS)
+
+    @property
+    def body(self) -> Optional[Dict[str, Any]]:
+        """Response body
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            Response body
+        """
+        return self._body
+
+    @body.setter
+    def body(self, body: Optional[Dict[str, Any]]) -> None:
+        self._body = body
+        self._raw_body: Optional[str] = None
 
     @property
     def raw_body(self) -> str:
         """Raw response body
 
+        The body is encoded once, on first access; setting `body` to a new value
+        encodes it again
+
         Returns
         -------
         Response body as a JSON string
         """
-        if self.body is not None:
-            return json.dumps(self.body)
-        return ""
+        if self._raw_body is None:
+            self._raw_body = _json_dumps(self._body) if self._body is not None else ""
+        return self._raw_body
 
     def dict(self) -> Dict[str, Any]:
         """Convert the instance to a dictionary for passing back the response
@@ -240,11 +382,10 @@ class LambdaResponse:
         """
         if not isinstance(obj, dict):
             raise ValueError("Cannot parse non-dictionary objects!")
-        try:
-            return cls(
-                status_code=obj["statusCode"],
-                body=obj.get("body"),
-                headers=obj.get("headers"),
-            )
-        except KeyError:
-            raise UnparseableResposeDictionary() from None
+        if "statusCode" not in obj:
+            raise UnparseableResposeDictionary()
+        return cls(
+            status_code=obj["statusCode"],
+            body=obj.get("body"),
+            headers=obj.get("headers"),
+        )
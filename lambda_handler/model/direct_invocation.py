@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import datetime as dt
+import re
 
 from pydantic import validator
 
-from .base import AwsEvent, BranchGenericModel, DataT
+from .base import AwsEvent, BranchGenericModel, DataT, cached_model_property
 
 from typing import Any, Dict, Generic, Optional
 
 __all__ = ["DirectInvocationDetail", "DirectInvocationEvent"]
 
 
+# Timestamps are almost always in the zero-padded `%Y/%m/%d %H:%M:%S` format,
+# which is much quicker to parse with this than with `strptime`
+_TIMESTAMP_RE = re.compile(r"(\d{4})/(\d{2})/(\d{2}) (\d{2}):(\d{2}):(\d{2})")
+
+
 ## DirectInvocation
 
 
@@ -67,9 +73,13 @@ class DirectInvocationEvent(AwsEvent, Generic[DataT]):
         """
 
         #: pylint: disable=no-self-argument
+        match = _TIMESTAMP_RE.fullmatch(value)
+        if match is not None:
+            year, month, day, hour, minute, second = map(int, match.groups())
+            return dt.datetime(year, month, day, hour, minute, second)
         return dt.datetime.strptime(value, "%Y/%m/%d %H:%M:%S")
 
-    @property
+    @cached_model_property
     def event_key(self) -> str:
         """The event key of a Direct Invocation event is its trigger
 
@@ -95,3 +105,20 @@ class DirectInvocationEvent(AwsEvent, Generic[DataT]):
             `True` if `event` is a Direct Invocation event
         """
         return "direct_invocation" in event
+
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed Direct Invocation event, read without
+        validating the event
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return event["direct_invocation"]["trigger"]
@@ -7,10 +7,11 @@ import uuid
 
 #: pylint: disable=no-name-in-module
 from pydantic import Field
+from pydantic.validators import str_validator
 
-from .base import AwsAccountNumber, AwsEvent, DataT
+from .base import AwsAccountNumber, AwsEvent, DataT, cached_model_property
 
-from typing import Any, Dict, Generic, List, Literal, Optional
+from typing import Any, Callable, Dict, Generic, Iterator, List, Literal, Optional
 
 #: pylint: enable=no-name-in-module
 
@@ -22,18 +23,66 @@ __all__ = ["EventBridgeResource", "EventBridgeEvent"]
 
 
 class EventBridgeResource(str):
-    """A `str` subtype that implements the `resource_name` property"""
+    """A `str` subtype that implements the `resource_name` attribute
 
-    @property
-    def resource_name(self) -> str:
-        """Resource name
+    Attributes
+    ----------
+    resource_name : Optional[str]
+        Resource name, or `None` if the ARN has no resource name, as for
+        S3 buckets
+    """
+
+    resource_name: Optional[str]
+
+    def __new__(cls, value: str) -> EventBridgeResource:
+        resource = super().__new__(cls, value)
+        # Resources are immutable, so the name is found once, here
+        _, separator, path = value.partition("/")
+        resource.resource_name = path.partition("/")[0] if separator else None
+        return resource
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], EventBridgeResource]]:
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> EventBridgeResource:
+        """Validate a resource ARN, which may be any string
+
+        Parameters
+        ----------
+        value : Any
+            Input value
 
         Returns
         -------
-        str
-            Resource name
+        EventBridgeResource
+            `EventBridgeResource` instance
         """
-        return self.split("/")[1]
+        return cls(str_validator(value))
+
+
+def _route_name(resource: EventBridgeResource) -> str:
+    """The resource name of the resource an EventBridge event is routed by
+
+    Parameters
+    ----------
+    resource : EventBridgeResource
+        The event's first resource
+
+    Returns
+    -------
+    str
+        Resource name
+
+    Raises
+    ------
+    ValueError
+        If `resource` has no resource name
+    """
+    if resource.resource_name is None:
+        raise ValueError(f"EventBridge resource `{resource}` has no resource name!")
+    return resource.resource_name
 
 
 class EventBridgeEvent(AwsEvent, Generic[DataT]):
@@ -78,7 +127,7 @@ class EventBridgeEvent(AwsEvent, Generic[DataT]):
     detail: DataT
     replay_name: Optional[str] = Field(None, alias="replay-name")
 
-    @property
+    @cached_model_property
     def resource_name(self) -> str:
         """The resource name of an EventBridge event is defined as the
         resource name of its first resource
@@ -87,10 +136,15 @@ class EventBridgeEvent(AwsEvent, Generic[DataT]):
         -------
         str
             Resource name
+
+        Raises
+        ------
+        ValueError
+            If the first resource has no resource name
         """
-        return self.resources[0].resource_name
+        return _route_name(self.resources[0])
 
-    @property
+    @cached_model_property
     def event_key(self) -> str:
         """The event key of an EventBridge event is its resource name
 
@@ -116,3 +170,20 @@ class EventBridgeEvent(AwsEvent, Generic[DataT]):
             `True` if `event` is an EventBridge event
         """
         return event.get("source") == "aws.events"
+
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed EventBridge event, read without
+        validating the event
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return _route_name(EventBridgeResource(event["resources"][0]))
@@ -6,10 +6,9 @@ import datetime as dt
 
 #: pylint: disable=no-name-in-module
 from pydantic import BaseModel, Field
-from pydantic.networks import IPvAnyNetwork
 from pydantic.types import NonNegativeFloat
 
-from .base import AwsEvent, BranchBaseModel
+from .base import AwsEvent, BranchBaseModel, cached_model_property
 
 from typing import (
     TYPE_CHECKING,
@@ -70,7 +69,8 @@ class S3Identity(BranchBaseModel):
 
 
 class S3RequestParameters(BranchBaseModel):
-    source_ip_address: IPvAnyNetwork = Field(alias="sourceIPAddress")
+    # Kept as the string AWS sends; use `ipaddress.ip_address` if needed
+    source_ip_address: str = Field(alias="sourceIPAddress")
 
 
 class S3ResponseElements(BranchBaseModel):
@@ -171,7 +171,7 @@ class S3Event(AwsEvent):
 
     records: List[S3Record] = Field(alias="Records")
 
-    @property
+    @cached_model_property
     def event_name(self) -> str:
         """S3 event name
 
@@ -182,7 +182,7 @@ class S3Event(AwsEvent):
         """
         return self.records[0].event_name
 
-    @property
+    @cached_model_property
     def event_key(self) -> str:
         """Event key, defined as the event name
 
@@ -195,8 +195,24 @@ class S3Event(AwsEvent):
 
     @classmethod
     def matches_event_type(cls, event: Dict[str, Any]) -> bool:
-        if "Records" in event:
-            records = event["Records"]
-            if isinstance(records, list):
-                return records[0].get("s3", None) is not None
+        records = event.get("Records")
+        if isinstance(records, list) and records:
+            return records[0].get("s3", None) is not None
         return False
+
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed S3 event, read without validating
+        the event
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return event["Records"][0]["eventName"]
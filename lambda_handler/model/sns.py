@@ -6,9 +6,8 @@ import datetime as dt
 
 #: pylint: disable=no-name-in-module
 from pydantic import BaseModel, Field
-from pydantic.networks import HttpUrl
 
-from .base import AwsEvent, BranchGenericModel, DataT
+from .base import AwsEvent, BranchGenericModel, DataT, cached_model_property
 
 from typing import (
     TYPE_CHECKING,
@@ -71,22 +70,19 @@ class SnsMessage(BranchGenericModel, Generic[DataT]):
         Message
     """
 
-    subject: Optional[str]
-    topic_arn: str
-    unsubscribe_url: HttpUrl
-    type: Literal["Notification"]
-    message_attributes: Optional[Dict[str, SnsMsgAttributeModel]]
-    message: Union[Json[DataT], str]
-    message_id: str
-    signing_cert_url: HttpUrl
-    signature: str
-    timestamp: dt.datetime
-    signature_version: str
-
-    class Config:
-        """Model configuration"""
-
-        alias_generator = lambda s: "".join(map(str.title, s.split("_")))  # noqa: E731
+    subject: Optional[str] = Field(alias="Subject")
+    topic_arn: str = Field(alias="TopicArn")
+    unsubscribe_url: str = Field(alias="UnsubscribeUrl")
+    type: Literal["Notification"] = Field(alias="Type")
+    message_attributes: Optional[Dict[str, SnsMsgAttributeModel]] = Field(
+        alias="MessageAttributes"
+    )
+    message: Union[Json[DataT], str] = Field(alias="Message")
+    message_id: str = Field(alias="MessageId")
+    signing_cert_url: str = Field(alias="SigningCertUrl")
+    signature: str = Field(alias="Signature")
+    timestamp: dt.datetime = Field(alias="Timestamp")
+    signature_version: str = Field(alias="SignatureVersion")
 
 
 class SnsRecord(BranchGenericModel, Generic[DataT]):
@@ -119,7 +115,7 @@ class SnsEvent(AwsEvent, Generic[DataT]):
 
     records: List[SnsRecord[DataT]] = Field(alias="Records")
 
-    @property
+    @cached_model_property
     def topic_name(self) -> str:
         """Topic name, defined as the event subscription ARN of the first record
 
@@ -128,9 +124,9 @@ class SnsEvent(AwsEvent, Generic[DataT]):
         str
             Topic name
         """
-        return self.records[0].sns.topic_arn.split(":")[-1]
+        return self.records[0].sns.topic_arn.rpartition(":")[2]
 
-    @property
+    @cached_model_property
     def event_key(self) -> str:
         """Event key, defined as the topic name
 
@@ -156,8 +152,24 @@ class SnsEvent(AwsEvent, Generic[DataT]):
             `True` if `event` is an SNS event
         """
 
-        if "Records" in event:
-            records = event["Records"]
-            if isinstance(records, list):
-                return records[0].get("Sns") is not None
+        records = event.get("Records")
+        if isinstance(records, list) and records:
+            return records[0].get("Sns") is not None
         return False
+
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed SNS event, read without validating
+        the event
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return event["Records"][0]["Sns"]["TopicArn"].rpartition(":")[2]
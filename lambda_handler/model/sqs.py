@@ -7,7 +7,13 @@ import datetime as dt
 #: pylint: disable=no-name-in-module
 from pydantic import Field
 
-from .base import AwsEvent, BranchBaseModel, BranchGenericModel, DataT
+from .base import (
+    AwsEvent,
+    BranchBaseModel,
+    BranchGenericModel,
+    DataT,
+    cached_model_property,
+)
 
 from typing import Any, Dict, Generic, List, Literal, Optional
 
@@ -43,20 +49,17 @@ class SqsRecordAttributes(BranchBaseModel):
         AWS trace header
     """
 
-    approximate_receive_count: str
-    approximate_first_receive_timestamp: dt.datetime
-    message_deduplication_id: Optional[str]
-    message_group_id: Optional[str]
-    sender_id: str
-    sent_timestamp: dt.datetime
-    sequence_number: Optional[str]
+    approximate_receive_count: str = Field(alias="ApproximateReceiveCount")
+    approximate_first_receive_timestamp: dt.datetime = Field(
+        alias="ApproximateFirstReceiveTimestamp"
+    )
+    message_deduplication_id: Optional[str] = Field(alias="MessageDeduplicationId")
+    message_group_id: Optional[str] = Field(alias="MessageGroupId")
+    sender_id: str = Field(alias="SenderId")
+    sent_timestamp: dt.datetime = Field(alias="SentTimestamp")
+    sequence_number: Optional[str] = Field(alias="SequenceNumber")
     aws_trace_header: Optional[str] = Field(alias="AWSTraceHeader")
 
-    class Config:
-        """Model configuration"""
-
-        alias_generator = lambda s: "".join(map(str.title, s.split("_")))  # noqa: E731
-
 
 class SqsMesssageAttributes(BranchBaseModel):
     """SQS Message attributes
@@ -132,7 +135,7 @@ class SqsEvent(AwsEvent, Generic[DataT]):
 
     records: List[SqsRecord[DataT]] = Field(alias="Records")
 
-    @property
+    @cached_model_property
     def queue_name(self) -> str:
         """Queue name, defined as the ARN of the first record's event source
 
@@ -141,9 +144,9 @@ class SqsEvent(AwsEvent, Generic[DataT]):
         str
             Queue name
         """
-        return self.records[0].event_source_arn.split(":")[-1]
+        return self.records[0].event_source_arn.rpartition(":")[2]
 
-    @property
+    @cached_model_property
     def event_key(self) -> str:
         """Event key, defined as the queue name
 
@@ -169,8 +172,24 @@ class SqsEvent(AwsEvent, Generic[DataT]):
             `True` if `event` is an SQS event
         """
 
-        if "Records" in event:
-            records = event["Records"]
-            if isinstance(records, list):
-                return records[0].get("eventSource") == "aws:sqs"
+        records = event.get("Records")
+        if isinstance(records, list) and records:
+            return records[0].get("eventSource") == "aws:sqs"
         return False
+
+    @classmethod
+    def raw_event_key(cls, event: Dict[str, Any]) -> str:
+        """The event key of an unparsed SQS event, read without validating
+        the event
+
+        Parameters
+        ----------
+        event : Dict[str, Any]
+            Unparsed Lambda event
+
+        Returns
+        -------
+        str
+            Event key
+        """
+        return event["Records"][0]["eventSourceARN"].rpartition(":")[2]
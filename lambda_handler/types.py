@@ -28,6 +28,8 @@ AwsEventRawCallable = Callable[[Dict[str, Any]], Dict[str, Any]]
 class LambdaHandlerInterface(Protocol):
     """Class with an `add_event_func` method"""
 
+    __slots__ = ()
+
     def add_event_func(
         self,
         event_type: Type[AwsEvent],
@@ -25,7 +25,18 @@ from lambda_handler.types import (
     LambdaHandlerInterface,
 )
 
-from typing import Any, Callable, Dict, List, Literal, Type, TypeVar, Union, overload
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 from typing_extensions import Concatenate, ParamSpec, TypeAlias
 
 #: pylint: enable=duplicate-code
@@ -34,10 +45,13 @@ from typing_extensions import Concatenate, ParamSpec, TypeAlias
 __all__ = [
     "AwsEventCallable",
     "DictCallable",
+    "EVENT_TYPES",
     "EventKeyMismatch",
     "OnetimeDictionary",
     "TypedCallable",
     "_P",
+    "find_event_key",
+    "find_event_type",
     "validate_function_signature",
     "parse_lambda_event",
 ]
@@ -53,10 +67,15 @@ _VT = TypeVar("_VT")
 class OnetimeDictionary(dict):
     """A dictionary which only allows a key to be set once"""
 
+    __slots__ = ()
+
     def __setitem__(self, __k: _KT, __v: _VT) -> None:
-        if __k in self:
+        # `setdefault` looks the key up and sets it in a single step; the key
+        # was already set if it didn't change the dictionary's size
+        size = len(self)
+        self.setdefault(__k, __v)
+        if len(self) == size:
             raise ValueError(f"The key {__k} has already been registered!")
-        return super().__setitem__(__k, __v)
 
 
 class EventKeyMismatch(Exception):
@@ -109,9 +128,9 @@ def validate_function_signature(func: Callable, input_type: Type[AwsEvent]) -> b
             f"`{func_name}` should only accept a single value besides its dependencies!"
         )
     if not issubclass(params[0].annotation, input_type):
-        print(params[0].annotation)
         raise ValueError(
-            f"`{func_name}` should accept a single parameter of type `{input_type}`"
+            f"`{func_name}` should accept a single parameter of type `{input_type}`,"
+            f" not `{params[0].annotation}`"
         )
     return True
 
@@ -121,6 +140,27 @@ DictCallable: TypeAlias = Callable[Concatenate[Dict[str, Any], _P], Dict[str, An
 TypedCallable: TypeAlias = Callable[Concatenate[AwsEventType, _P], LambdaResponse]
 
 
+def _find_dependencies(func: Callable) -> List[Tuple[str, DependencyC]]:
+    """Find the dependencies of `func`, which are the defaults of its
+    parameters that are `DependencyC` instances
+
+    Parameters
+    ----------
+    func : Callable
+        Function to find the dependencies of
+
+    Returns
+    -------
+    List[Tuple[str, DependencyC]]
+        Parameter names and dependencies
+    """
+    return [
+        (k, p.default)
+        for k, p in inspect.signature(func).parameters.items()
+        if isinstance(p.default, DependencyC)
+    ]
+
+
 def create_raw_outer(
     handler: LambdaHandlerInterface,
     event_type: Type[AwsEventType],
@@ -146,15 +186,16 @@ def create_raw_outer(
     """
 
     def outer(func: DictCallable) -> AwsEventRawCallable:
+        dependencies = _find_dependencies(func)
+
+        # Without dependencies, `func` already has the signature of a raw handler
+        if not dependencies:
+            handler.add_event_func(event_type, event_key, func)
+            return func
+
         @wraps(func)
         def inner(event: Dict[str, Any]) -> Dict[str, Any]:
-            sig = inspect.signature(func)
-            dependencies: Dict[str, Any] = {
-                k: p.default()
-                for k, p in sig.parameters.items()
-                if isinstance(p.default, DependencyC)
-            }
-            return func(event, **dependencies)
+            return func(event, **{k: dependency() for k, dependency in dependencies})
 
         handler.add_event_func(event_type, event_key, inner)
 
@@ -186,6 +227,25 @@ def create_typed_outer(
     """
 
     def outer(func: TypedCallable) -> AwsEventRawCallable:
+        # Get the actual event type from the annotation, once per function
+        params = list(inspect.signature(func).parameters.values())
+        concrete_event_type: Type[AwsEvent] = params[0].annotation
+        parse_event = concrete_event_type.parse_obj
+        pattern = re.compile(event_key)
+        dependencies = _find_dependencies(func)
+
+        # Only functions with dependencies need them added to each call
+        call: Callable[[AwsEvent], LambdaResponse]
+        if dependencies:
+
+            def call(parsed_event: AwsEvent) -> LambdaResponse:
+                return func(
+                    parsed_event, **{k: dependency() for k, dependency in dependencies}
+                )
+
+        else:
+            call = func
+
         @wraps(func)
         def inner(event: Dict[str, Any]) -> Dict[str, Any]:
             """Parses the event to the correct type and passes it to `func`
@@ -200,23 +260,12 @@ def create_typed_outer(
             LambdaResponse
                 `LambdaResponse` instance
             """
-            # Get the actual event type from the annotation
-            sig = inspect.signature(func)
-            params = list(sig.parameters.values())
-            concrete_event_type = params[0].annotation
-
-            dependencies: Dict[str, Any] = {
-                k: p.default()
-                for k, p in sig.parameters.items()
-                if isinstance(p.default, DependencyC)
-            }
-
-            parsed_event = concrete_event_type.parse_obj(event)
-            if not re.match(event_key, parsed_event.event_key):
+            parsed_event = parse_event(event)
+            if not pattern.match(parsed_event.event_key):
                 raise EventKeyMismatch(
                     f"Event key mismatch! `'{parsed_event.event_key}' != '{event_key}'`"
                 )
-            return func(parsed_event, **dependencies).dict()
+            return call(parsed_event).dict()
 
         handler.add_event_func(event_type, event_key, inner)
 
@@ -304,6 +353,66 @@ def create_wrapper(
     )
 
 
+EVENT_TYPES: List[Type[AwsEvent]] = [
+    ApiGatewayEvent,
+    DirectInvocationEvent,
+    EventBridgeEvent,
+    S3Event,
+    SnsEvent,
+    SqsEvent,
+]
+
+
+def find_event_type(event: Dict[str, Any]) -> Type[AwsEvent]:
+    """Find the `AwsEvent` type of a Lambda event dictionary; the first type in
+    `EVENT_TYPES` that matches the event takes precedence
+
+    Parameters
+    ----------
+    event : Dict[str, Any]
+        Lambda event
+
+    Returns
+    -------
+    Type[AwsEvent]
+        Event type
+
+    Raises
+    ------
+    UnknownEventType
+        If `event` is not of any known event type
+    """
+    for event_type in EVENT_TYPES:
+        if event_type.matches_event_type(event):
+            return event_type
+
+    raise UnknownEventType(f"Cannot parse event `{event}`!")
+
+
+def find_event_key(event_type: Type[AwsEvent], event: Dict[str, Any]) -> str:
+    """Find the event key of an unparsed event of type `event_type`
+
+    The key is read straight from the event dictionary, without parsing it; a
+    malformed event is parsed instead, so that it raises a validation error
+
+    Parameters
+    ----------
+    event_type : Type[AwsEvent]
+        Event type, as found by `find_event_type`
+    event : Dict[str, Any]
+        Lambda event
+
+    Returns
+    -------
+    str
+        Event key
+    """
+    try:
+        return event_type.raw_event_key(event)
+    except (AttributeError, IndexError, KeyError, TypeError):
+        return event_type.parse_obj(event).event_key
+
+
 def parse_lambda_event(event: Dict[str, Any]) -> AwsEvent:
     """Parses a Dictionary from an lambda event to an `AwsEvent` type
 
@@ -322,19 +431,6 @@ def parse_lambda_event(event: Dict[str, Any]) -> AwsEvent:
     UnknownEventType
         If it cannot parse `event`
     """
-    event_types: List[Type[AwsEvent]] = [
-        ApiGatewayEvent,
-        DirectInvocationEvent,
-        EventBridgeEvent,
-        S3Event,
-        SnsEvent,
-        SqsEvent,
-    ]
-
-    for event_type in event_types:
-        if event_type.matches_event_type(event):
-            name = event_type.__qualname__
-            logging.info("Found %s event type", name)
-            return event_type.parse_obj(event)
-
-    raise UnknownEventType(f"Cannot parse event `{event}`!")
+    event_type = find_event_type(event)
+    logging.info("Found %s event type", event_type.__qualname__)
+    return event_type.parse_obj(event)
@@ -0,0 +1,32 @@
+import pytest
+
+from lambda_handler import LambdaHandler
+
+from typing import Iterator
+
+#: pylint: disable=redefined-outer-name
+
+
+@pytest.fixture(scope="module")
+def handler() -> LambdaHandler:
+    """Handler fixture, shared by the tests in each module
+
+    Returns
+    -------
+    LambdaHandler
+        Handler instance
+    """
+    return LambdaHandler()
+
+
+@pytest.fixture(autouse=True)
+def clear_handler(handler: LambdaHandler) -> Iterator[None]:
+    """Remove the functions each test registers on the shared handler
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+    yield
+    handler.clear()
@@ -5,6 +5,7 @@ from pathlib import Path
 __all__ = [
     "direct_invocation_event_dict",
     "direct_invocation_event_model_dict",
+    "event_bridge_event_dict",
     "s3_event_dict",
     "sns_event_dict",
     "sns_event_model_dict",
@@ -15,6 +16,10 @@ __all__ = [
 
 events_path = Path(__file__).parent
 
+event_bridge_event_dict = json.loads(
+    (events_path / "eventBridgeEvent.json").read_text(encoding="utf-8")
+)
+
 s3_event_dict = json.loads((events_path / "s3Event.json").read_text(encoding="utf-8"))
 
 sns_event_dict = json.loads((events_path / "snsEvent.json").read_text(encoding="utf-8"))
@@ -0,0 +1,77 @@
+"""Timings for dispatching events and validating handler functions; these need
+`pytest-benchmark`, and are skipped unless run with `pytest --benchmark-only`"""
+
+import pytest
+
+from lambda_handler import LambdaHandler, LambdaResponse, SnsEvent
+from lambda_handler.model import AwsEvent
+from lambda_handler.utils import validate_function_signature
+
+from .events import sns_event_dict
+
+from typing import Any, Dict
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(autouse=True)
+def benchmark_only(request: pytest.FixtureRequest) -> None:
+    """Skip benchmarks in normal test runs
+
+    Parameters
+    ----------
+    request: pytest.FixtureRequest
+        Test request
+    """
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmarks only run with `--benchmark-only`")
+
+
+def test_sns_benchmark(benchmark) -> None:
+    """Time a typed SNS function, called through the handler
+
+    Parameters
+    ----------
+    benchmark
+        `pytest-benchmark` fixture
+    """
+    handler = LambdaHandler()
+
+    @handler.sns(topic_name="MyTopic")
+    def test_func(event: SnsEvent) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    assert LambdaResponse.parse_obj(benchmark(handler, sns_event_dict, ""))
+
+
+def test_sns_raw_benchmark(benchmark) -> None:
+    """Time a raw SNS function, called through the handler, which measures
+    the handler's own dispatch without any event parsing
+
+    Parameters
+    ----------
+    benchmark
+        `pytest-benchmark` fixture
+    """
+    handler = LambdaHandler()
+
+    @handler.sns(topic_name="MyTopic", raw=True)
+    def test_func(event: Dict[str, Any]) -> Dict[str, Any]:
+        return {"statusCode": "200"}
+
+    assert LambdaResponse.parse_obj(benchmark(handler, sns_event_dict, ""))
+
+
+def test_validate_function_signature_benchmark(benchmark) -> None:
+    """Time validating a function's signature
+
+    Parameters
+    ----------
+    benchmark
+        `pytest-benchmark` fixture
+    """
+
+    def correct_types(first: AwsEvent) -> LambdaResponse:
+        pass
+
+    assert benchmark(validate_function_signature, correct_types, AwsEvent)
@@ -1,5 +1,7 @@
+import datetime as dt
+
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from lambda_handler import LambdaHandler, LambdaResponse
 from lambda_handler.model import DirectInvocationEvent
@@ -75,3 +77,41 @@ def test_direct_invocation(
     response_dict = handler(event_dict, "")
 
     assert LambdaResponse.parse_obj(response_dict)
+
+
+@pytest.mark.parametrize(
+    ["time_stamp", "expected"],
+    [
+        ("2022/01/01 12:34:56", dt.datetime(2022, 1, 1, 12, 34, 56)),
+        ("2022/1/1 2:34:56", dt.datetime(2022, 1, 1, 2, 34, 56)),
+    ],
+)
+def test_direct_invocation_time_stamp(time_stamp: str, expected: dt.datetime) -> None:
+    """Test that both padded and unpadded timestamps are parsed
+
+    Parameters
+    ----------
+    time_stamp: str
+        Event timestamp
+    expected: dt.datetime
+        Parsed timestamp
+    """
+    event = DirectInvocationEvent.parse_obj(
+        {**direct_invocation_event_dict, "time_stamp": time_stamp}
+    )
+    assert event.time_stamp == expected
+
+
+@pytest.mark.parametrize("time_stamp", ["2022-01-01 12:34:56", "2022/13/01 12:34:56"])
+def test_direct_invocation_bad_time_stamp(time_stamp: str) -> None:
+    """Test that invalid timestamps fail validation
+
+    Parameters
+    ----------
+    time_stamp: str
+        Event timestamp
+    """
+    with pytest.raises(ValidationError):
+        DirectInvocationEvent.parse_obj(
+            {**direct_invocation_event_dict, "time_stamp": time_stamp}
+        )
@@ -0,0 +1,83 @@
+import pytest
+
+from lambda_handler import EventBridgeEvent, LambdaHandler, LambdaResponse
+
+from .events import event_bridge_event_dict
+
+from typing import Any, Dict
+
+#: pylint: disable=redefined-outer-name
+
+
+@pytest.fixture()
+def handler() -> LambdaHandler:
+    """Handler fixture
+
+    Returns
+    -------
+    LambdaHandler
+        Handler instance
+    """
+    return LambdaHandler()
+
+
+def test_event_bridge(handler: LambdaHandler) -> None:
+    """Test that a function that accepts an `EventBridgeEvent` and returns a
+    `LambdaResponse` correctly registers on the handler and returns a
+    `LambdaResponse`
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    @handler.event_bridge(resource_name="my-scheduled-rule")
+    def test_func(event: EventBridgeEvent) -> LambdaResponse:
+        assert event.event_key == "my-scheduled-rule"
+        return LambdaResponse(status_code="200")
+
+    assert isinstance(test_func(event_bridge_event_dict), dict)
+
+    response_dict = handler(event_bridge_event_dict, "")
+
+    assert LambdaResponse.parse_obj(response_dict)
+
+
+def test_event_bridge_resource_without_name() -> None:
+    """Test that resources without a resource name, such as S3 buckets, are
+    valid, and only the first resource's name is needed for the event key
+    """
+    bucket = "arn:aws:s3:::my-bucket"
+    rule = event_bridge_event_dict["resources"][0]
+
+    event = EventBridgeEvent.parse_obj(
+        {**event_bridge_event_dict, "resources": [rule, bucket]}
+    )
+    assert event.resources[1].resource_name is None
+    assert event.event_key == "my-scheduled-rule"
+
+    event = EventBridgeEvent.parse_obj(
+        {**event_bridge_event_dict, "resources": [bucket]}
+    )
+    assert event.resources[0] == bucket
+    with pytest.raises(ValueError, match="has no resource name"):
+        _ = event.event_key
+
+
+def test_event_bridge_route_without_name(handler: LambdaHandler) -> None:
+    """Test that routing an event whose first resource has no resource name
+    fails
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    @handler.event_bridge(resource_name="my-scheduled-rule", raw=True)
+    def test_func(event: Dict[str, Any]) -> Dict[str, Any]:
+        return {"statusCode": "200"}
+
+    with pytest.raises(ValueError, match="has no resource name"):
+        handler({**event_bridge_event_dict, "resources": ["arn:aws:s3:::bucket"]}, "")
@@ -1,8 +1,13 @@
+import json
+
 import pytest
 
-from lambda_handler import LambdaHandler
+from lambda_handler import LambdaHandler, LambdaResponse, SnsEvent
+from lambda_handler.handler import NoFastAPIInstanceError
 from fastapi import FastAPI
 
+from .events import sns_event_dict
+
 
 def test_fastapi():
     fastapi = FastAPI()
@@ -14,3 +19,85 @@ def test_fastapi_again():
     handler = LambdaHandler()
     fastapi = FastAPI()
     handler.fastapi_app = fastapi
+
+
+def test_api_gateway_event_without_fastapi():
+    handler = LambdaHandler()
+
+    with pytest.raises(NoFastAPIInstanceError):
+        handler({"pathParameters": None}, "")
+
+
+def test_fastapi_not_an_app():
+    with pytest.raises(ValueError, match="must be a `FastAPI` instance"):
+        LambdaHandler(fastapi_app=object())
+
+
+def test_fastapi_mangum_shared():
+    fastapi = FastAPI()
+
+    handler = LambdaHandler(fastapi_app=fastapi)
+    other_handler = LambdaHandler()
+    other_handler.fastapi_app = fastapi
+
+    assert handler.mangum is other_handler.mangum
+    assert handler.mangum is not LambdaHandler(fastapi_app=FastAPI()).mangum
+
+
+def test_fastapi_mangum_created_on_first_use():
+    handler = LambdaHandler(fastapi_app=FastAPI())
+
+    assert handler._mangum is None
+    assert handler.mangum is not None
+    assert handler._mangum is handler.mangum
+
+
+def test_fastapi_api_gateway_event():
+    fastapi = FastAPI()
+
+    @fastapi.get("/things/{thing_id}")
+    def get_thing(thing_id: str):
+        return {"thing": thing_id}
+
+    handler = LambdaHandler(fastapi_app=fastapi)
+    event = {
+        "resource": "/things/{thing_id}",
+        "path": "/things/1",
+        "httpMethod": "GET",
+        "headers": {"accept": "application/json", "host": "example.com"},
+        "multiValueHeaders": {},
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": {"thing_id": "1"},
+        "stageVariables": None,
+        "requestContext": {
+            "resourcePath": "/things/{thing_id}",
+            "httpMethod": "GET",
+            "path": "/things/1",
+            "stage": "prod",
+            "identity": {"sourceIp": "192.168.0.1"},
+        },
+        "body": None,
+        "isBase64Encoded": False,
+    }
+
+    response = handler(event, {})
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"]) == {"thing": "1"}
+
+
+def test_fastapi_sns_event():
+    handler = LambdaHandler(fastapi_app=FastAPI())
+
+    @handler.sns(topic_name="MyTopic")
+    def handle(event: SnsEvent) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    assert handler(sns_event_dict, "") == {
+        "isBase64Encoded": False,
+        "statusCode": "200",
+        "body": "",
+        "headers": dict(LambdaResponse.DEFAULT_HEADERS),
+    }
+    assert handler._mangum is None
@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from lambda_handler import LambdaResponse
+from lambda_handler.model import UnparseableResposeDictionary
+
+
+def test_response_headers_copied() -> None:
+    """Test that changing a response's headers doesn't change the defaults"""
+    response = LambdaResponse(status_code="200")
+    response.headers["X-Requested-With"] = "me"
+
+    assert LambdaResponse.DEFAULT_HEADERS["X-Requested-With"] == "*"
+    assert LambdaResponse(status_code="200").headers["X-Requested-With"] == "*"
+
+
+def test_response_raw_body() -> None:
+    """Test that the raw body is encoded again when the body is set"""
+    response = LambdaResponse(status_code="200")
+    assert response.raw_body == ""
+
+    response.body = {"thing": 1}
+    assert json.loads(response.raw_body) == {"thing": 1}
+    assert json.loads(response.dict()["body"]) == {"thing": 1}
+
+
+def test_response_raw_body_wide_integer() -> None:
+    """Test that a body with an integer wider than 64 bits can be encoded"""
+    response = LambdaResponse(status_code="200", body={"big": 2**70})
+    assert json.loads(response.raw_body) == {"big": 2**70}
+
+
+def test_response_parse_obj_no_status_code() -> None:
+    """Test that a dictionary without a status code can't be parsed"""
+    with pytest.raises(UnparseableResposeDictionary):
+        LambdaResponse.parse_obj({"body": ""})
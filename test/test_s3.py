@@ -36,3 +36,29 @@ def test_s3(handler: LambdaHandler) -> None:
     response_dict = handler(s3_event_dict, "")
 
     assert LambdaResponse.parse_obj(response_dict)
+
+
+def test_s3_plain_event_name(handler: LambdaHandler) -> None:
+    """Test that an event name without any regular expression characters
+    matches the start of the event key, as `re.match` would
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    @handler.s3(event_name="ObjectCreated:")
+    def test_func(event: S3Event) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    response_dict = handler(s3_event_dict, "")
+
+    assert LambdaResponse.parse_obj(response_dict)
+
+
+def test_s3_source_ip_address() -> None:
+    """Test that the source IP address is kept as it is sent"""
+    event = S3Event.parse_obj(s3_event_dict)
+
+    assert event.records[0].request_parameters.source_ip_address == "192.169.0.1"
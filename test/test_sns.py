@@ -3,32 +3,20 @@ from pydantic import BaseModel, ValidationError
 
 from lambda_handler import LambdaHandler, LambdaResponse, Dependency
 from lambda_handler.handler import ExistingRouteError, InvalidRouteError
-from lambda_handler.model import SnsEvent
+from lambda_handler.model import AwsEvent, SnsEvent
 from lambda_handler.utils import EventKeyMismatch
 
 from .events import (
     another_sns_event_dict,
     bad_sns_event_dict,
+    event_bridge_event_dict,
     sns_event_dict,
     sns_event_model_dict,
+    sqs_event_dict,
 )
 
 from typing import Any, Dict, Iterator
 
-#: pylint: disable=redefined-outer-name
-
-
-@pytest.fixture()
-def handler() -> LambdaHandler:
-    """Handler fixture
-
-    Returns
-    -------
-    LambdaHandler
-        Handler instance
-    """
-    return LambdaHandler()
-
 
 @pytest.mark.parametrize(
     ["topic_name", "event_dict"],
@@ -55,7 +43,6 @@ def test_sns(
 
     @handler.sns(topic_name=topic_name)
     def test_func(event: SnsEvent[Dict[str, Any]]) -> LambdaResponse:
-        print(event)
         return LambdaResponse(status_code="200")
 
     assert isinstance(test_func(event_dict), dict)
@@ -65,6 +52,10 @@ def test_sns(
     assert LambdaResponse.parse_obj(response_dict)
 
 
+class MyModel(BaseModel):
+    thing: str
+
+
 @pytest.mark.parametrize(
     ["topic_name", "event_dict"],
     [
@@ -87,16 +78,11 @@ def test_sns_model(
         Event dictionary
     """
 
-    class MyModel(BaseModel):
-        thing: str
-
     @handler.sns(topic_name=topic_name)
     def test_func(event: SnsEvent[MyModel]) -> LambdaResponse:
         assert isinstance(event.records[0].sns.message, MyModel)
         return LambdaResponse(status_code="200")
 
-    assert isinstance(test_func(event_dict), dict)
-
     response_dict = handler(event_dict, "")
 
     assert LambdaResponse.parse_obj(response_dict)
@@ -129,10 +115,7 @@ def test_sns_raw(
     def test_func(event: Dict[str, Any]) -> Dict[str, Any]:
         return {"statusCode": "200"}
 
-    assert isinstance(test_func(event_dict), dict)
-
     response_dict = handler(event_dict, "")
-    print(response_dict)
 
     assert LambdaResponse.parse_obj(response_dict)
 
@@ -160,8 +143,6 @@ def test_sns_topic_mismatch(
         Event dictionary
     """
 
-    handler = LambdaHandler()
-
     @handler.sns(topic_name=topic_name)
     def test_func(event: SnsEvent) -> LambdaResponse:
         return LambdaResponse(status_code="200")
@@ -191,8 +172,6 @@ def test_sns_topic_invalid_route(
         Event dictionary
     """
 
-    handler = LambdaHandler()
-
     with pytest.raises(InvalidRouteError):
         _ = handler(event_dict, "")
 
@@ -234,3 +213,191 @@ def test_sns_bad_event(handler: LambdaHandler) -> None:
 
     with pytest.raises(ValidationError):
         _ = test_func(bad_sns_event_dict)
+
+
+def test_unknown_event_type_fails(handler: LambdaHandler) -> None:
+    """Test that registering a function for an unsupported event type
+    raises a `ValueError`
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    with pytest.raises(ValueError, match="`AwsEvent`"):
+        handler.add_event_func(AwsEvent, "MyTopic", lambda event: event)
+
+
+def test_sns_other_event_type_invalid_route(handler: LambdaHandler) -> None:
+    """Test that a handler with only SNS routes still identifies, and
+    rejects, events of other types
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    @handler.sns(topic_name="MyTopic")
+    def test_func(event: SnsEvent) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    with pytest.raises(InvalidRouteError, match="SqsEvent"):
+        _ = handler(sqs_event_dict, "")
+
+    # An event matching an earlier event type is of that type, even if it
+    # also looks like an SNS event
+    event = {**event_bridge_event_dict, "Records": sns_event_dict["Records"]}
+    with pytest.raises(InvalidRouteError, match="EventBridgeEvent"):
+        _ = handler(event, "")
+
+
+def test_sns_event_key_cached() -> None:
+    """Test that an event's key is computed once and isn't exported as a field"""
+
+    event = SnsEvent.parse_obj(sns_event_dict)
+
+    assert event.event_key == "MyTopic"
+    assert event._cache == {"event_key": "MyTopic", "topic_name": "MyTopic"}
+    assert "event_key" not in event.dict()
+    assert "topic_name" not in event.dict()
+
+
+def test_sns_event_key_copy() -> None:
+    """Test that a copy of an event with updated records has its own key"""
+
+    event = SnsEvent.parse_obj(sns_event_dict)
+    other = SnsEvent.parse_obj(another_sns_event_dict)
+
+    assert event.event_key == "MyTopic"
+    copied = event.copy(update={"records": other.records})
+    assert copied.event_key == "MyOtherTopic"
+    assert event.event_key == "MyTopic"
+
+
+def test_sns_event_key_assignment() -> None:
+    """Test that assigning to an event's fields clears its cached key"""
+
+    event = SnsEvent.parse_obj(sns_event_dict)
+    other = SnsEvent.parse_obj(another_sns_event_dict)
+
+    assert event.event_key == "MyTopic"
+    event.records = other.records
+    assert event.event_key == "MyOtherTopic"
+    assert event.topic_name == "MyOtherTopic"
+
+
+def test_sns_message_decoded_exactly() -> None:
+    """Test that message content `orjson` can't decode exactly, if it's
+    installed, is still decoded as `json` decodes it
+    """
+    record = sns_event_dict["Records"][0]
+    message = '{"big": 123456789012345678901234567890, "nan": NaN}'
+    event = SnsEvent[Dict[str, Any]].parse_obj(
+        {"Records": [{**record, "Sns": {**record["Sns"], "Message": message}}]}
+    )
+
+    content = event.records[0].sns.message
+    assert isinstance(content, dict)
+    assert content["big"] == 123456789012345678901234567890
+    assert content["nan"] != content["nan"]
+
+
+def test_sns_raw_not_validated(handler: LambdaHandler) -> None:
+    """Test that the handler routes events to `raw` functions without
+    validating them against the event model
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    @handler.sns(topic_name="MyTopic", raw=True)
+    def test_func(event: Dict[str, Any]) -> Dict[str, Any]:
+        return {"statusCode": "200"}
+
+    assert handler(bad_sns_event_dict, "") == {"statusCode": "200"}
+
+
+def test_sns_dependencies(handler: LambdaHandler) -> None:
+    """Test that a function's dependencies are passed to it on every call
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    def numbers() -> Iterator[int]:
+        yield 1
+
+    calls = []
+
+    @handler.sns(topic_name="MyTopic")
+    def test_func(
+        event: SnsEvent,
+        number: int = Dependency(numbers),
+        uncached: int = Dependency(lambda: len(calls), use_cache=False),
+    ) -> LambdaResponse:
+        calls.append((number, uncached))
+        return LambdaResponse(status_code="200")
+
+    @handler.sns(topic_name="MyOtherTopic", raw=True)
+    def test_raw_func(
+        event: Dict[str, Any], number: int = Dependency(numbers)
+    ) -> Dict[str, Any]:
+        calls.append((number, None))
+        return {"statusCode": "200"}
+
+    handler(sns_event_dict, "")
+    handler(sns_event_dict, "")
+    handler(another_sns_event_dict, "")
+
+    assert calls == [(1, 0), (1, 1), (1, None)]
+
+
+def test_sns_clear(handler: LambdaHandler) -> None:
+    """Test that clearing a handler removes its routes, so that they can be
+    registered again
+
+    Parameters
+    ----------
+    handler: LambdaHandler
+        `LambdaHandler` instance
+    """
+
+    def test_func(event: SnsEvent) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    handler.sns(topic_name="MyTopic")(test_func)
+    handler.clear()
+
+    with pytest.raises(InvalidRouteError):
+        _ = handler(sns_event_dict, "")
+
+    handler.sns(topic_name="MyTopic")(test_func)
+
+    assert LambdaResponse.parse_obj(handler(sns_event_dict, ""))
+
+
+def test_sns_subclass_process_event() -> None:
+    """Test that calling a handler goes through a subclass's `process_event`"""
+    calls = []
+
+    class MyHandler(LambdaHandler):
+        """Handler that records the events it processes"""
+
+        def process_event(self, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+            calls.append(event)
+            return super().process_event(event, context)
+
+    handler = MyHandler()
+
+    @handler.sns(topic_name="MyTopic")
+    def test_func(event: SnsEvent) -> LambdaResponse:
+        return LambdaResponse(status_code="200")
+
+    assert LambdaResponse.parse_obj(handler(sns_event_dict, ""))
+    assert calls == [sns_event_dict]
@@ -1,22 +1,8 @@
-import pytest
-
 from lambda_handler import LambdaHandler, LambdaResponse, SqsEvent
 
 from .events import sqs_event_dict
 
 
-@pytest.fixture()
-def handler() -> LambdaHandler:
-    """Handler fixture
-
-    Returns
-    -------
-    LambdaHandler
-        Handler instance
-    """
-    return LambdaHandler()
-
-
 def test_sns(handler: LambdaHandler) -> None:
     """Test that a function that accepts an `SqsEvent` and returns a `LambdaResponse`
     correctly registers on the handler and returns a `LambdaResponse`
@@ -1,14 +1,40 @@
 import pytest
 
 from lambda_handler.dependencies import Dependency
-from lambda_handler.model import AwsEvent, LambdaResponse
-from lambda_handler.utils import OnetimeDictionary, validate_function_signature
+from lambda_handler.model import (
+    AwsEvent,
+    EventBridgeEvent,
+    LambdaResponse,
+    SnsEvent,
+    SqsEvent,
+)
+from lambda_handler.model.base import to_camel
+from lambda_handler.utils import (
+    OnetimeDictionary,
+    UnknownEventType,
+    find_event_key,
+    find_event_type,
+    validate_function_signature,
+)
+
+from .events import (
+    direct_invocation_event_dict,
+    event_bridge_event_dict,
+    s3_event_dict,
+    sns_event_dict,
+    sqs_event_dict,
+)
+
+from typing import Iterator
 
 
 def my_func() -> int:
     return 1
 
 
+my_func_dependency = Dependency(my_func)
+
+
 def test_onetime_dictionary():
     d = OnetimeDictionary()
     d[0] = 0
@@ -68,9 +94,87 @@ def test_validate_function_signature():
 
 
 def test_validate_function_signature_with_dependency():
-    def correct_types(
-        first: AwsEvent, dependency=Dependency(my_func)
-    ) -> LambdaResponse:
+    def correct_types(first: AwsEvent, dependency=my_func_dependency) -> LambdaResponse:
         pass
 
     assert validate_function_signature(correct_types, AwsEvent)
+
+
+def test_dependency_caches_falsy_result():
+    calls = []
+
+    def falsy() -> int:
+        calls.append(1)
+        return 0
+
+    dependency = Dependency(falsy)
+
+    assert dependency() == 0
+    assert dependency() == 0
+    assert len(calls) == 1
+
+
+def test_generator_dependency():
+    def generator() -> Iterator[int]:
+        yield 1
+
+    assert Dependency(generator)() == 1
+
+
+def test_find_event_type_same_keys():
+    """Events with the same top-level keys are still told apart"""
+    assert find_event_type(sns_event_dict) is SnsEvent
+    assert find_event_type(sqs_event_dict) is SqsEvent
+    assert find_event_type(sns_event_dict) is SnsEvent
+
+
+def test_find_event_type_precedence():
+    """Which type an event has doesn't depend on the events seen before it"""
+    event = {**event_bridge_event_dict, "Records": sns_event_dict["Records"]}
+    other_event = {**event, "source": "aws.other"}
+
+    assert find_event_type(event) is EventBridgeEvent
+    assert find_event_type(other_event) is SnsEvent
+    assert find_event_type(event) is EventBridgeEvent
+
+
+def test_find_event_type_unknown():
+    with pytest.raises(UnknownEventType):
+        find_event_type({"unknown": "event"})
+
+
+@pytest.mark.parametrize(
+    "event_dict",
+    [
+        direct_invocation_event_dict,
+        s3_event_dict,
+        sns_event_dict,
+        sqs_event_dict,
+    ],
+)
+def test_find_event_key(event_dict):
+    """Reading the key from an unparsed event agrees with the parsed event"""
+    event_type = find_event_type(event_dict)
+
+    assert find_event_key(event_type, event_dict) == (
+        event_type.parse_obj(event_dict).event_key
+    )
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ("records", "records"),
+        ("event_source_arn", "eventSourceArn"),
+        ("s3_schema_version", "s3SchemaVersion"),
+        ("message_ID", "messageId"),
+        ("double__underscore", "doubleUnderscore"),
+    ],
+)
+def test_to_camel(name, expected):
+    assert to_camel(name) == expected
+
+
+def test_find_event_type_empty_records():
+    with pytest.raises(UnknownEventType):
+        find_event_type({"Records": []})